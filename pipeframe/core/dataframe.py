@@ -57,6 +57,10 @@ class DataFrame:
     trusted sources.
     """
 
+    # A wrapper is allocated at every pipe step; slots drop the per-instance
+    # __dict__ since _data is the only state
+    __slots__ = ("_data",)
+
     def __init__(
         self,
         data: Optional[Any] = None,
@@ -267,6 +271,19 @@ class DataFrame:
         """
         return cls(df, copy=copy)
 
+    @classmethod
+    def _from_trusted(cls, df: pd.DataFrame) -> "DataFrame":
+        """
+        Wrap an already-validated pandas DataFrame without re-running __init__.
+
+        Internal constructor for results produced by pandas itself (groupby
+        reductions, reshapes) where re-validation would be redundant. Callers
+        must guarantee ``df`` is a pandas DataFrame.
+        """
+        obj = cls.__new__(cls)
+        obj._data = df
+        return obj
+
     def to_numpy(self) -> np.ndarray:
         """Convert to numpy array."""
         return self._data.to_numpy()
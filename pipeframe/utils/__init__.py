@@ -6,6 +6,7 @@ Provides helpful decorators, profiling tools, and debugging utilities.
 
 from .helpers import (
     Snapshot,
+    cached_check,
     catch_empty,
     check_data_quality,
     describe_pipeline,
@@ -19,6 +20,7 @@ __all__ = [
     # Decorators
     "timer",
     "catch_empty",
+    "cached_check",
     "validate_columns",
     # Snapshot and compare
     "Snapshot",
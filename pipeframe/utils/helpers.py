@@ -7,6 +7,7 @@ even more convenient.
 
 from typing import Any, Callable, Dict, List, Optional, Union
 from functools import wraps
+import inspect
 import time
 import warnings
 
@@ -260,6 +261,74 @@ def profile_pipeline(df: DataFrame, *operations: Callable, verbose: bool = True)
 # ============================================================================
 
 
+class _SharedArtifacts(dict):
+    """
+    Lazily-computed DataFrame artifacts shared across quality checks.
+
+    Checks that accept a ``shared`` keyword can pull commonly needed
+    intermediates (e.g. ``shared['isnull']``) so each is computed at most
+    once per check run instead of once per check.
+    """
+
+    _builders = {
+        "isnull": lambda d: d.isnull(),
+        "dtypes": lambda d: d.dtypes,
+        "nunique": lambda d: d.nunique(),
+    }
+
+    def __init__(self, data: pd.DataFrame):
+        super().__init__()
+        self._data = data
+
+    def __missing__(self, key: str) -> Any:
+        builder = self._builders.get(key)
+        if builder is None:
+            raise KeyError(key)
+        value = builder(self._data)
+        self[key] = value
+        return value
+
+
+def _accepts_shared(check: Callable) -> bool:
+    """Return True if a check function accepts a 'shared' keyword argument."""
+    try:
+        return "shared" in inspect.signature(check).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+def cached_check(check: Callable) -> Callable:
+    """
+    Decorator memoizing a quality check for the most recently seen DataFrame.
+
+    Useful when the same check runs repeatedly against the same frame
+    (e.g. inside validation loops). The wrapper keeps a reference to the
+    last frame and compares by identity, so a recycled object address can
+    never be mistaken for a cache hit. Any extra arguments are part of
+    the cache key, so calling the check with different options recomputes.
+
+    Examples
+    --------
+    >>> @cached_check
+    ... def no_nulls(df):
+    ...     return df.isnull().sum().sum() == 0
+    """
+
+    @wraps(check)
+    def wrapper(data: Any, *args: Any, **kwargs: Any) -> Any:
+        extras = (args, tuple(sorted(kwargs.items())))
+        if wrapper._last is not data or wrapper._last_extras != extras:
+            wrapper._result = check(data, *args, **kwargs)
+            wrapper._last = data
+            wrapper._last_extras = extras
+        return wrapper._result
+
+    wrapper._last = None
+    wrapper._last_extras = None
+    wrapper._result = None
+    return wrapper
+
+
 def check_data_quality(
     df: DataFrame, checks: Optional[Dict[str, Callable]] = None
 ) -> Dict[str, bool]:
@@ -271,13 +340,20 @@ def check_data_quality(
     df : DataFrame
         DataFrame to check
     checks : dict, optional
-        Custom checks as {name: check_function}
+        Custom checks as {name: check_function}. A check may declare a
+        ``shared`` keyword argument to receive a dict of lazily-computed
+        artifacts ('isnull', 'dtypes', 'nunique') reused across checks.
 
     Returns
     -------
     dict
         Results of each check
 
+    Notes
+    -----
+    Failing checks are collected and reported in a single aggregated
+    warning rather than one warning per failure.
+
     Examples
     --------
     >>> checks = {
@@ -295,14 +371,22 @@ def check_data_quality(
 
     all_checks = {**default_checks, **(checks or {})}
     data = df._data if isinstance(df, DataFrame) else df
+    shared = _SharedArtifacts(data)
 
     results = {}
+    errors = []
     for name, check in all_checks.items():
         try:
-            results[name] = bool(check(data))
+            if _accepts_shared(check):
+                results[name] = bool(check(data, shared=shared))
+            else:
+                results[name] = bool(check(data))
         except Exception as e:
             results[name] = False
-            warnings.warn(f"Check '{name}' failed: {e}")
+            errors.append(f"'{name}' ({e})")
+
+    if errors:
+        warnings.warn(f"Data quality checks failed: {', '.join(errors)}")
 
     return results
 
@@ -0,0 +1,131 @@
+"""
+Numba-accelerated group aggregation kernels for summarize().
+
+Each kernel makes a single pass over the value array, accumulating into a
+per-group slot indexed by the grouper codes, instead of going through
+pandas' generic per-group dispatch. Numba caches a compiled kernel per
+input dtype, so the JIT cost is paid once per (dtype, func) pair.
+
+The module is importable without numba installed; ``try_numba_agg``
+simply returns None so callers fall back to the pandas path.
+"""
+
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+try:  # Optional dependency - enables JIT fast paths when installed
+    import numba as _numba
+except ImportError:  # pragma: no cover
+    _numba = None
+
+
+if _numba is not None:
+
+    @_numba.njit(cache=True)
+    def nb_group_sum(codes, values, out):  # pragma: no cover
+        for i in range(values.shape[0]):
+            c = codes[i]
+            if c < 0:
+                continue
+            v = values[i]
+            if not np.isnan(v):
+                out[c] += v
+
+    @_numba.njit(cache=True)
+    def nb_group_mean(codes, values, sums, counts):  # pragma: no cover
+        for i in range(values.shape[0]):
+            c = codes[i]
+            if c < 0:
+                continue
+            v = values[i]
+            if not np.isnan(v):
+                sums[c] += v
+                counts[c] += 1
+
+    @_numba.njit(cache=True)
+    def nb_group_minmax(codes, values, mins, maxs, counts):  # pragma: no cover
+        for i in range(values.shape[0]):
+            c = codes[i]
+            if c < 0:
+                continue
+            v = values[i]
+            if not np.isnan(v):
+                counts[c] += 1
+                if v < mins[c]:
+                    mins[c] = v
+                if v > maxs[c]:
+                    maxs[c] = v
+
+    def _run_sum(codes: np.ndarray, values: np.ndarray, ngroups: int) -> np.ndarray:
+        out = np.zeros(ngroups)
+        nb_group_sum(codes, values, out)
+        return out
+
+    def _run_mean(codes: np.ndarray, values: np.ndarray, ngroups: int) -> np.ndarray:
+        sums = np.zeros(ngroups)
+        counts = np.zeros(ngroups, dtype=np.int64)
+        nb_group_mean(codes, values, sums, counts)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return sums / counts
+
+    def _run_min(codes: np.ndarray, values: np.ndarray, ngroups: int) -> np.ndarray:
+        mins = np.full(ngroups, np.inf)
+        maxs = np.full(ngroups, -np.inf)
+        counts = np.zeros(ngroups, dtype=np.int64)
+        nb_group_minmax(codes, values, mins, maxs, counts)
+        mins[counts == 0] = np.nan
+        return mins
+
+    def _run_max(codes: np.ndarray, values: np.ndarray, ngroups: int) -> np.ndarray:
+        mins = np.full(ngroups, np.inf)
+        maxs = np.full(ngroups, -np.inf)
+        counts = np.zeros(ngroups, dtype=np.int64)
+        nb_group_minmax(codes, values, mins, maxs, counts)
+        maxs[counts == 0] = np.nan
+        return maxs
+
+    _KERNELS = {
+        "sum": _run_sum,
+        "mean": _run_mean,
+        "min": _run_min,
+        "max": _run_max,
+    }
+else:
+    _KERNELS = {}
+
+
+def try_numba_agg(grouped: Any, agg_specs: Dict[str, Any]) -> Optional[pd.DataFrame]:
+    """
+    Aggregate via the JIT kernels when every spec qualifies.
+
+    Requires numba, NamedAgg specs with supported aggfuncs, and float64
+    value columns (so NaN handling and output dtypes match pandas).
+    Returns the aggregated frame indexed by the group keys, or None when
+    the pandas path should be used instead.
+    """
+    if _numba is None or not agg_specs:
+        return None
+
+    obj = grouped.obj
+    plan = []
+    for name, spec in agg_specs.items():
+        if not isinstance(spec, pd.NamedAgg) or spec.aggfunc not in _KERNELS:
+            return None
+        if spec.column not in obj.columns or obj[spec.column].dtype != np.float64:
+            return None
+        plan.append((name, spec.column, spec.aggfunc))
+
+    grouper = getattr(grouped, "_grouper", None) or getattr(grouped, "grouper", None)
+    try:
+        codes = np.ascontiguousarray(grouper.group_info[0], dtype=np.int64)
+        ngroups = grouper.ngroups
+        index = grouper.result_index
+    except (AttributeError, TypeError):  # pragma: no cover - internal API drift
+        return None
+
+    out_cols = {}
+    for name, col, func in plan:
+        out_cols[name] = _KERNELS[func](codes, obj[col].to_numpy(), ngroups)
+    return pd.DataFrame(out_cols, index=index)
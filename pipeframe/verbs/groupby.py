@@ -36,14 +36,18 @@ class GroupBy:
         dropna: bool = True,
     ):
         """Initialize GroupBy."""
-        self._df = df
-        self._by = [by] if isinstance(by, str) else by
-
-        # Get pandas DataFrame
+        # Get pandas DataFrame; wrap raw pandas input without a copy so
+        # ungroup() still returns a PipeFrame DataFrame
         if isinstance(df, DataFrame):
             pdf = df._data
         else:
             pdf = df
+            df = DataFrame._from_trusted(pdf)
+
+        self._df = df
+        self._by = [by] if isinstance(by, str) else by
+        self._sort = sort
+        self._dropna = dropna
 
         self._grouped = pdf.groupby(
             by=by,
@@ -73,69 +77,81 @@ class GroupBy:
 
     def size(self) -> Series:
         """Return size of each group."""
+        # Single-key unsorted groupby only needs a count per label, so a
+        # one-pass hash count via value_counts skips building group indices.
+        # Categorical keys stay on the grouper path: value_counts reports
+        # unobserved categories, which the observed flag controls there.
+        # So does dropna=False: value_counts keeps the original missing
+        # label (e.g. None) where the grouper normalizes it to NaN.
+        if len(self._by) == 1 and not self._sort and self._dropna:
+            data = self._df._data if isinstance(self._df, DataFrame) else self._df
+            key = data[self._by[0]]
+            if not isinstance(key.dtype, pd.CategoricalDtype):
+                counts = key.value_counts(sort=False, dropna=self._dropna)
+                return Series(counts.rename(None))
         return Series(self._grouped.size())
 
     def count(self) -> DataFrame:
         """Count non-NA values in each group."""
-        return DataFrame(self._grouped.count())
+        return DataFrame._from_trusted(self._grouped.count())
 
     def sum(self, numeric_only: bool = True) -> DataFrame:
         """Sum values in each group."""
-        return DataFrame(self._grouped.sum(numeric_only=numeric_only))
+        return DataFrame._from_trusted(self._grouped.sum(numeric_only=numeric_only))
 
     def mean(self, numeric_only: bool = True) -> DataFrame:
         """Mean of each group."""
-        return DataFrame(self._grouped.mean(numeric_only=numeric_only))
+        return DataFrame._from_trusted(self._grouped.mean(numeric_only=numeric_only))
 
     def median(self, numeric_only: bool = True) -> DataFrame:
         """Median of each group."""
-        return DataFrame(self._grouped.median(numeric_only=numeric_only))
+        return DataFrame._from_trusted(self._grouped.median(numeric_only=numeric_only))
 
     def min(self, numeric_only: bool = True) -> DataFrame:
         """Minimum of each group."""
-        return DataFrame(self._grouped.min(numeric_only=numeric_only))
+        return DataFrame._from_trusted(self._grouped.min(numeric_only=numeric_only))
 
     def max(self, numeric_only: bool = True) -> DataFrame:
         """Maximum of each group."""
-        return DataFrame(self._grouped.max(numeric_only=numeric_only))
+        return DataFrame._from_trusted(self._grouped.max(numeric_only=numeric_only))
 
     def std(self, ddof: int = 1, numeric_only: bool = True) -> DataFrame:
         """Standard deviation of each group."""
-        return DataFrame(self._grouped.std(ddof=ddof, numeric_only=numeric_only))
+        return DataFrame._from_trusted(self._grouped.std(ddof=ddof, numeric_only=numeric_only))
 
     def var(self, ddof: int = 1, numeric_only: bool = True) -> DataFrame:
         """Variance of each group."""
-        return DataFrame(self._grouped.var(ddof=ddof, numeric_only=numeric_only))
+        return DataFrame._from_trusted(self._grouped.var(ddof=ddof, numeric_only=numeric_only))
 
     def first(self) -> DataFrame:
         """First value in each group."""
-        return DataFrame(self._grouped.first())
+        return DataFrame._from_trusted(self._grouped.first())
 
     def last(self) -> DataFrame:
         """Last value in each group."""
-        return DataFrame(self._grouped.last())
+        return DataFrame._from_trusted(self._grouped.last())
 
     def head(self, n: int = 5) -> DataFrame:
         """First n rows of each group."""
-        return DataFrame(self._grouped.head(n))
+        return DataFrame._from_trusted(self._grouped.head(n))
 
     def tail(self, n: int = 5) -> DataFrame:
         """Last n rows of each group."""
-        return DataFrame(self._grouped.tail(n))
+        return DataFrame._from_trusted(self._grouped.tail(n))
 
     def apply(self, func: Callable, *args: Any, **kwargs: Any) -> DataFrame:
         """Apply function to each group."""
         result = self._grouped.apply(func, *args, **kwargs)
         if isinstance(result, pd.DataFrame):
-            return DataFrame(result)
+            return DataFrame._from_trusted(result)
         elif isinstance(result, pd.Series):
-            return DataFrame(result.to_frame())
+            return DataFrame._from_trusted(result.to_frame())
         return result
 
     def agg(self, func: Union[str, List, Dict], **kwargs: Any) -> DataFrame:
         """Aggregate using one or more operations."""
         result = self._grouped.agg(func, **kwargs)
-        return DataFrame(result.reset_index())
+        return DataFrame._from_trusted(result.reset_index())
 
     def aggregate(self, func: Union[str, List, Dict], **kwargs: Any) -> DataFrame:
         """Alias for agg."""
@@ -144,12 +160,12 @@ class GroupBy:
     def transform(self, func: Union[str, Callable], *args: Any, **kwargs: Any) -> DataFrame:
         """Transform values in each group."""
         result = self._grouped.transform(func, *args, **kwargs)
-        return DataFrame(result)
+        return DataFrame._from_trusted(result)
 
     def filter(self, func: Callable, dropna: bool = True) -> DataFrame:
         """Filter groups based on function."""
         result = self._grouped.filter(func, dropna=dropna)
-        return DataFrame(result)
+        return DataFrame._from_trusted(result)
 
     def ungroup(self) -> DataFrame:
         """Return ungrouped DataFrame."""
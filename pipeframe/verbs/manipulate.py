@@ -15,10 +15,18 @@ All functions include comprehensive input validation and security hardening.
 """
 
 from typing import Any, Callable, Dict, List, Optional, Union
+import ast
+import operator
+import sys
 import pandas as pd
 import numpy as np
 import re
-from functools import partial
+from functools import lru_cache, partial
+
+try:  # Optional dependency - enables JIT fast paths when installed
+    import numba as _numba
+except ImportError:  # pragma: no cover
+    _numba = None
 
 from ..core.dataframe import DataFrame
 from ..core.series import Series
@@ -29,6 +37,7 @@ from ..exceptions import (
     PipeFrameTypeError,
     PipeFrameValueError,
 )
+from ._numba_agg import try_numba_agg
 
 
 # =============================================================================
@@ -45,6 +54,102 @@ def _validate_dataframe(df: Any, operation: str) -> None:
         raise PipeFrameEmptyDataError(operation)
 
 
+# Dangerous patterns blocked in string expressions (basic protection).
+# Compiled once into a single alternation so each expression is scanned in
+# one linear pass instead of one regex pass per pattern.
+_DANGEROUS_PATTERNS = [
+    r"__import__",
+    r"exec\s*\(",
+    r"eval\s*\(",
+    r"compile\s*\(",
+    r"open\s*\(",
+    r"file\s*\(",
+]
+
+_DANGEROUS_RE = re.compile(
+    "|".join(f"({pattern})" for pattern in _DANGEROUS_PATTERNS), re.IGNORECASE
+)
+
+
+def _check_dangerous_expression(expr: str) -> None:
+    """Raise PipeFrameExpressionError if expr matches a dangerous pattern."""
+    match = _DANGEROUS_RE.search(expr)
+    if match:
+        pattern = _DANGEROUS_PATTERNS[match.lastindex - 1]
+        raise PipeFrameExpressionError(
+            expr, f"Expression contains potentially dangerous pattern: {pattern}"
+        )
+
+
+_ARITHMETIC_NODES = (
+    ast.Expression,
+    ast.BinOp,
+    ast.UnaryOp,
+    ast.Name,
+    ast.Constant,
+    ast.Load,
+    ast.Add,
+    ast.Sub,
+    ast.Mult,
+    ast.Div,
+    ast.FloorDiv,
+    ast.Mod,
+    ast.Pow,
+    ast.USub,
+    ast.UAdd,
+)
+
+
+def _try_arrow_numexpr(df: pd.DataFrame, expr: str) -> Optional[pd.Series]:
+    """
+    Evaluate a pure-arithmetic expression over Arrow-backed columns directly
+    with numexpr, bypassing the pandas eval() wrapper.
+
+    Arrow-backed numeric columns expose their buffers to numpy without a
+    materializing copy, so handing them straight to numexpr halves the memory
+    traffic of df.eval(). Returns None when the fast path does not apply
+    (no Arrow columns, non-arithmetic expression, or numexpr unavailable).
+    """
+    try:
+        import numexpr
+    except ImportError:
+        return None
+
+    try:
+        tree = ast.parse(expr, mode="eval")
+    except SyntaxError:
+        return None
+
+    names = set()
+    for node in ast.walk(tree):
+        if not isinstance(node, _ARITHMETIC_NODES):
+            return None
+        if isinstance(node, ast.Name):
+            names.add(node.id)
+
+    if not names or not names.issubset(df.columns):
+        return None
+
+    local_dict = {}
+    any_arrow = False
+    for name in names:
+        dtype = df[name].dtype
+        if isinstance(dtype, pd.ArrowDtype):
+            any_arrow = True
+        elif not (isinstance(dtype, np.dtype) and np.issubdtype(dtype, np.number)):
+            return None
+        local_dict[name] = np.asarray(df[name].array)
+
+    if not any_arrow:
+        return None
+
+    try:
+        result = numexpr.evaluate(expr, local_dict=local_dict, global_dict={})
+    except Exception:
+        return None
+    return pd.Series(result, index=df.index)
+
+
 def _safe_eval_expression(df: pd.DataFrame, expr: str, column_name: str) -> pd.Series:
     """
     Safely evaluate expression with input validation.
@@ -58,21 +163,7 @@ def _safe_eval_expression(df: pd.DataFrame, expr: str, column_name: str) -> pd.S
             "Expression must be string", expected_type=str, got_type=type(expr)
         )
 
-    # Check for dangerous patterns (basic protection)
-    dangerous_patterns = [
-        r"__import__",
-        r"exec\s*\(",
-        r"eval\s*\(",
-        r"compile\s*\(",
-        r"open\s*\(",
-        r"file\s*\(",
-    ]
-
-    for pattern in dangerous_patterns:
-        if re.search(pattern, expr, re.IGNORECASE):
-            raise PipeFrameExpressionError(
-                expr, f"Expression contains potentially dangerous pattern: {pattern}"
-            )
+    _check_dangerous_expression(expr)
 
     try:
         import numpy as np
@@ -96,6 +187,11 @@ def _safe_eval_expression(df: pd.DataFrame, expr: str, column_name: str) -> pd.S
             result = eval(expr, namespace)
             return result
         else:
+            # Arrow-backed numeric columns can feed numexpr zero-copy
+            result = _try_arrow_numexpr(df, expr)
+            if result is not None:
+                return result
+
             # Use pandas eval for simple DataFrame expressions (safer and faster)
             result = df.eval(expr, level=0)
             return result
@@ -146,6 +242,35 @@ def _define_impl(df: Union[DataFrame, pd.DataFrame], **kwargs: Any) -> DataFrame
     return DataFrame(result)
 
 
+class _DefineOp:
+    """
+    Callable pipe step produced by define()/mutate().
+
+    Chaining two define steps with '>>' before applying them to a frame
+    fuses their column definitions into a single step, so the pipeline
+    copies the frame once instead of once per define. Fusion is skipped
+    when the steps redefine the same column, since later definitions may
+    depend on the intermediate value.
+    """
+
+    __slots__ = ("kwargs",)
+
+    def __init__(self, kwargs: Dict[str, Any]):
+        self.kwargs = kwargs
+
+    def __call__(self, df: Union[DataFrame, pd.DataFrame]) -> DataFrame:
+        return _define_impl(df, **self.kwargs)
+
+    def __rshift__(self, other: Any) -> Any:
+        if isinstance(other, _DefineOp):
+            if set(self.kwargs) & set(other.kwargs):
+                # Overlapping targets - keep sequential semantics
+                first, second = self, other
+                return lambda df: second(first(df))
+            return _DefineOp({**self.kwargs, **other.kwargs})
+        return NotImplemented
+
+
 def define(**kwargs: Any) -> Callable:
     """
     Create or modify columns - curry-friendly wrapper for pipe operator.
@@ -159,7 +284,9 @@ def define(**kwargs: Any) -> Callable:
     Returns
     -------
     Callable
-        Function that takes a DataFrame and applies column definitions
+        Function that takes a DataFrame and applies column definitions.
+        Consecutive define steps composed with '>>' are fused into a
+        single pass over the frame.
 
     Security
     --------
@@ -171,55 +298,53 @@ def define(**kwargs: Any) -> Callable:
     >>> df >> define(z='x + y')
     >>> df >> define(ratio='x / y', total='x + y')
     >>> df >> define(category=if_else('value > 0', 'positive', 'negative'))
+    >>> df >> (define(a='x + 1') >> define(b='a * 2'))  # fused single pass
     """
-    return lambda df: _define_impl(df, **kwargs)
+    return _DefineOp(kwargs)
 
 
 # Alias
 mutate = define
 
 
-def _select_impl(df: Union[DataFrame, pd.DataFrame], *args: Any) -> DataFrame:
-    """
-    Select columns by name or pattern.
-    Implementation function - use select() for pipe-friendly version.
-    """
-    _validate_dataframe(df, "select")
-
-    if isinstance(df, DataFrame):
-        data = df._data
-    else:
-        data = df
-
-    all_cols = list(data.columns)
+def _resolve_select_args(args: tuple, all_cols: List[str]) -> List[str]:
+    """Resolve select() arguments to an ordered, de-duplicated column list."""
     cols = []
+    col_to_idx = {col: i for i, col in enumerate(all_cols)}
 
     for arg in args:
         if isinstance(arg, str):
-            if ":" in arg:
+            start, sep, end = arg.partition(":")
+            if sep:
                 # Range selection
-                start, end = arg.split(":", 1)
-                if start not in all_cols:
-                    raise PipeFrameColumnError(start, all_cols)
-                if end not in all_cols:
-                    raise PipeFrameColumnError(end, all_cols)
-
-                start_idx = all_cols.index(start)
-                end_idx = all_cols.index(end)
-                cols.extend(all_cols[start_idx : end_idx + 1])
+                missing = [c for c in (start, end) if c not in col_to_idx]
+                if missing:
+                    raise PipeFrameColumnError(missing[0], all_cols)
+
+                cols.extend(all_cols[col_to_idx[start] : col_to_idx[end] + 1])
             else:
                 # Single column
-                if arg not in all_cols:
+                if arg not in col_to_idx:
                     raise PipeFrameColumnError(arg, all_cols)
                 cols.append(arg)
-        elif isinstance(arg, list):
+        elif isinstance(arg, (list, tuple)):
             for col in arg:
-                if col not in all_cols:
+                if col not in col_to_idx:
                     raise PipeFrameColumnError(col, all_cols)
             cols.extend(arg)
         elif callable(arg):
-            # Function selector
-            selected = [col for col in all_cols if arg(col)]
+            # Function selector - prefer a single vectorized pass over the
+            # column Index when the predicate supports it (selection helpers
+            # do); fall back to per-column calls for plain predicates.
+            selected = None
+            try:
+                mask = np.asarray(arg(pd.Index(all_cols)))
+                if mask.dtype == bool and mask.shape == (len(all_cols),):
+                    selected = [col for col, keep in zip(all_cols, mask) if keep]
+            except Exception:
+                selected = None
+            if selected is None:
+                selected = [col for col in all_cols if arg(col)]
             cols.extend(selected)
         else:
             raise PipeFrameTypeError(
@@ -234,6 +359,41 @@ def _select_impl(df: Union[DataFrame, pd.DataFrame], *args: Any) -> DataFrame:
             seen.add(col)
             unique_cols.append(col)
 
+    return unique_cols
+
+
+@lru_cache(maxsize=256)
+def _resolve_select_cached(args_key: tuple, cols_key: tuple) -> tuple:
+    """Cached resolver so repeated selections over identical schemas parse once."""
+    return tuple(_resolve_select_args(args_key, list(cols_key)))
+
+
+def _select_impl(df: Union[DataFrame, pd.DataFrame], *args: Any) -> DataFrame:
+    """
+    Select columns by name or pattern.
+    Implementation function - use select() for pipe-friendly version.
+    """
+    _validate_dataframe(df, "select")
+
+    if isinstance(df, DataFrame):
+        data = df._data
+    else:
+        data = df
+
+    all_cols = list(data.columns)
+
+    # Cache resolution per (args, columns) signature. Callables are skipped
+    # because their equality is unreliable as a cache key.
+    if any(callable(arg) for arg in args):
+        unique_cols = _resolve_select_args(args, all_cols)
+    else:
+        try:
+            args_key = tuple(tuple(arg) if isinstance(arg, list) else arg for arg in args)
+            unique_cols = list(_resolve_select_cached(args_key, tuple(all_cols)))
+        except TypeError:
+            # Unhashable arguments or column labels - resolve directly
+            unique_cols = _resolve_select_args(args, all_cols)
+
     if not unique_cols:
         raise PipeFrameValueError("No columns selected")
 
@@ -445,10 +605,23 @@ def slice_rows(
     else:
         data = df
 
+    # Fast path: a full-range slice with step 1 is a no-op, so skip the
+    # BlockManager slice and constructor call entirely.
+    if step == 1 and start == 0 and (stop is None or stop >= len(data)):
+        return df if isinstance(df, DataFrame) else DataFrame(df)
+
     if stop is None:
         stop = len(data)
 
-    result = data.iloc[start:stop:step]
+    if step == 1:
+        # Contiguous slice shares blocks under copy-on-write
+        result = data.iloc[start:stop]
+    else:
+        # take() routes through the C take_nd kernel. Normalize the bounds
+        # the way a slice would first: take() resolves negative indices
+        # per element and raises on out-of-range ones instead of clipping.
+        indices = np.arange(*slice(start, stop, step).indices(len(data)))
+        result = data.take(indices)
     return DataFrame(result)
 
 
@@ -635,12 +808,20 @@ def _group_by_impl(df: Union[DataFrame, pd.DataFrame], *columns: str) -> Any:
     if not columns:
         raise PipeFrameValueError("Must specify at least one column to group by")
 
+    # sort=False skips the O(n log n) key sort and observed=True keeps
+    # categorical keys from materializing empty Cartesian-product groups
     if isinstance(df, DataFrame):
-        return df.groupby(list(columns))
-    else:
-        from ..core.dataframe import DataFrame as DF
+        return df.groupby(list(columns), sort=False, observed=True)
 
-        return DF(df).groupby(list(columns))
+    # Raw pandas input: validate here and build the GroupBy directly
+    # instead of round-tripping through a wrapper DataFrame
+    from .groupby import GroupBy
+
+    invalid = [col for col in columns if col not in df.columns]
+    if invalid:
+        raise PipeFrameColumnError(f"GroupBy columns {invalid}", list(df.columns))
+
+    return GroupBy(df, by=list(columns), sort=False, observed=True)
 
 
 def group_by(*columns: str) -> Callable:
@@ -655,7 +836,9 @@ def group_by(*columns: str) -> Callable:
     Returns
     -------
     Callable
-        Function that takes a DataFrame and applies grouping
+        Function that takes a DataFrame and applies grouping. Groups keep
+        first-occurrence order (no key sort) and categorical keys only
+        produce observed combinations.
 
     Examples
     --------
@@ -664,7 +847,73 @@ def group_by(*columns: str) -> Callable:
     return lambda df: _group_by_impl(df, *columns)
 
 
-def _summarize_impl(grouped_df: Any, **kwargs: Any) -> DataFrame:
+_AGG_EXPR_RE = re.compile(r"(\w+)\((.*?)\)")
+
+
+def _parse_agg_specs(kwargs: Dict[str, Any]) -> List[tuple]:
+    """
+    Parse summarize() expressions like 'mean(col)' once, at wrapper build time.
+
+    Returns uniform 4-tuples: ('agg', name, func, col) for parsed string
+    expressions, ('obj', name, None, value) for non-string values (callables
+    among them run as user-defined aggregations on the grouped path), and
+    ('invalid', name, expr, None) for unparseable strings (surfaced when
+    the wrapper is applied, matching the previous call-time error).
+    """
+    parsed = []
+    for col_name, expr in kwargs.items():
+        if isinstance(expr, str):
+            match = _AGG_EXPR_RE.match(expr)
+            if match:
+                parsed.append(("agg", col_name, match.group(1), match.group(2).strip()))
+            else:
+                parsed.append(("invalid", col_name, expr, None))
+        else:
+            parsed.append(("obj", col_name, None, expr))
+    return parsed
+
+
+def _build_agg_plan(parsed: List[tuple]) -> tuple:
+    """
+    Classify parsed summary specs into pandas aggregation inputs once.
+
+    Returns (agg_specs, count_cols, invalid, udfs): the named-aggregation
+    dict, count column names and callable specs consumed by the grouped
+    path, plus any invalid expressions (raised when the wrapper is
+    applied, matching the previous call-time error).
+    """
+    agg_specs = {}
+    count_cols = []
+    invalid = []
+    udfs = []
+
+    for kind, col_name, func_name, col in parsed:
+        if kind == "invalid":
+            invalid.append(func_name)
+        elif kind == "obj":
+            if callable(col):
+                udfs.append((col_name, col))
+        elif kind != "agg":
+            continue
+        elif func_name in ("count", "n", "size"):
+            # Use size() for count - handled separately
+            count_cols.append(col_name)
+        elif col:
+            # Use pandas named aggregation format
+            agg_specs[col_name] = pd.NamedAgg(column=col, aggfunc=func_name)
+        else:
+            # Aggregate all numeric columns
+            agg_specs[col_name] = func_name
+
+    return agg_specs, count_cols, invalid, udfs
+
+
+_NUMBA_ENGINE_KWARGS = {"nopython": True, "nogil": True, "parallel": True}
+
+
+def _summarize_impl(
+    grouped_df: Any, parsed: List[tuple], plan: tuple, engine: str = "python"
+) -> DataFrame:
     """
     Reduce groups to summaries.
 
@@ -672,8 +921,12 @@ def _summarize_impl(grouped_df: Any, **kwargs: Any) -> DataFrame:
     ----------
     grouped_df : GroupBy or DataFrame
         Grouped data frame
-    **kwargs : dict
-        Summary definitions with aggregation functions
+    parsed : list of tuple
+        Pre-parsed summary definitions from _parse_agg_specs
+    plan : tuple
+        (agg_specs, count_cols, invalid, udfs) from _build_agg_plan
+    engine : {'python', 'numba'}, default 'python'
+        Execution engine for callable (user-defined) aggregations
 
     Returns
     -------
@@ -687,56 +940,65 @@ def _summarize_impl(grouped_df: Any, **kwargs: Any) -> DataFrame:
     from .groupby import GroupBy
 
     if isinstance(grouped_df, GroupBy):
-        # Build aggregation dict
-        agg_specs = {}
-
-        for col_name, expr in kwargs.items():
-            if isinstance(expr, str):
-                # Parse expression like 'mean(col)'
-                match = re.match(r"(\w+)\((.*?)\)", expr)
-                if match:
-                    func_name = match.group(1)
-                    col = match.group(2).strip()
-
-                    # Special cases
-                    if func_name in ["count", "n", "size"]:
-                        # Use size() for count
-                        pass  # Handle separately
-                    elif col:
-                        # Use pandas named aggregation format
-                        agg_specs[col_name] = pd.NamedAgg(column=col, aggfunc=func_name)
-                    else:
-                        # Aggregate all numeric columns
-                        agg_specs[col_name] = func_name
-                else:
-                    raise PipeFrameExpressionError(expr, "Invalid aggregation expression")
-
-        # Handle count specially
-        count_cols = [
-            k
-            for k, v in kwargs.items()
-            if isinstance(v, str) and v.split("(")[0] in ["count", "n", "size"]
-        ]
-
-        if count_cols:
+        agg_specs, count_cols, invalid, udfs = plan
+        if invalid:
+            raise PipeFrameExpressionError(invalid[0], "Invalid aggregation expression")
+
+        result = None
+
+        if count_cols and agg_specs:
+            # Fuse the count into the same agg call so pandas makes a
+            # single pass over the groups instead of size() + agg() + join().
+            # "size" ignores its input, but NamedAgg still needs a non-key
+            # column to bind to.
+            data = grouped_df._df._data
+            value_col = next((c for c in data.columns if c not in grouped_df._by), None)
+            if value_col is not None:
+                fused = {name: pd.NamedAgg(column=value_col, aggfunc="size") for name in count_cols}
+                fused.update(agg_specs)
+                result = grouped_df._grouped.agg(**fused)
+
+        if result is None and count_cols:
             # Use size() for count - get underlying pandas DataFrame
-            result_df = grouped_df.size().to_frame("count")._data
-            if len(count_cols) > 1 or len(agg_specs) > 0:
+            result = grouped_df.size().to_frame("count")._data
+            if agg_specs:
                 # Combine with other aggregations
-                if agg_specs:
-                    agg_result = grouped_df._grouped.agg(**agg_specs)
-                    result_df = result_df.join(agg_result)
+                agg_result = grouped_df._grouped.agg(**agg_specs)
+                result = result.join(agg_result)
             # Rename count column
             if count_cols[0] != "count":
-                result_df = result_df.rename(columns={"count": count_cols[0]})
-            return DataFrame(result_df.reset_index())
-
-        # Regular aggregations
-        if agg_specs:
-            result = grouped_df._grouped.agg(**agg_specs)
-            return DataFrame(result.reset_index())
+                result = result.rename(columns={"count": count_cols[0]})
+        elif result is None and agg_specs:
+            # Regular aggregations - single-pass JIT kernels when available
+            result = try_numba_agg(grouped_df._grouped, agg_specs)
+            if result is None:
+                result = grouped_df._grouped.agg(**agg_specs)
+
+        if udfs:
+            # Callable specs run per group; engine='numba' routes them
+            # through pandas' JIT pathway (compiled funcs are cached by
+            # pandas per function after warmup)
+            engine_kw = (
+                {"engine": "numba", "engine_kwargs": _NUMBA_ENGINE_KWARGS}
+                if engine == "numba"
+                else {}
+            )
+            for name, func in udfs:
+                udf_result = grouped_df._grouped.agg(func, **engine_kw)
+                if isinstance(udf_result, pd.Series):
+                    udf_result = udf_result.to_frame(name)
+                elif len(udf_result.columns) == 1:
+                    udf_result.columns = [name]
+                else:
+                    # The callable aggregated every value column; keep the
+                    # spec name as a prefix so it stays visible and the
+                    # joined columns never collide across specs
+                    udf_result.columns = [f"{name}_{c}" for c in udf_result.columns]
+                result = udf_result if result is None else result.join(udf_result)
 
-        return DataFrame(pd.DataFrame())
+        if result is None:
+            return DataFrame(pd.DataFrame())
+        return DataFrame(result.reset_index())
 
     else:
         # Ungrouped DataFrame - summarize entire frame
@@ -746,32 +1008,33 @@ def _summarize_impl(grouped_df: Any, **kwargs: Any) -> DataFrame:
             data = grouped_df
 
         result_dict = {}
-        for col_name, expr in kwargs.items():
-            if isinstance(expr, str):
-                match = re.match(r"(\w+)\((.*?)\)", expr)
-                if match:
-                    func_name = match.group(1)
-                    col = match.group(2).strip()
-
-                    if func_name in ["count", "n"]:
-                        result_dict[col_name] = len(data)
-                    elif hasattr(data, func_name):
-                        func = getattr(data, func_name)
-                        val = func(numeric_only=True)
-                        if col and col in val.index:
-                            result_dict[col_name] = val[col]
-                        else:
-                            result_dict[col_name] = val.iloc[0] if len(val) > 0 else None
+        for kind, col_name, func_name, col in parsed:
+            if kind != "agg":
+                continue
+
+            if func_name in ["count", "n"]:
+                result_dict[col_name] = len(data)
+            elif hasattr(data, func_name):
+                func = getattr(data, func_name)
+                val = func(numeric_only=True)
+                if col and col in val.index:
+                    result_dict[col_name] = val[col]
+                else:
+                    result_dict[col_name] = val.iloc[0] if len(val) > 0 else None
 
         return DataFrame([result_dict])
 
 
-def summarize(**kwargs: Any) -> Callable:
+def summarize(engine: str = "python", **kwargs: Any) -> Callable:
     """
     Reduce groups to summaries - curry-friendly wrapper for pipe operator.
 
     Parameters
     ----------
+    engine : {'python', 'numba'}, default 'python'
+        Execution engine for callable aggregations. 'numba' JIT-compiles
+        the function via pandas (nopython, nogil, parallel); string
+        expressions always use the built-in pandas reductions.
     **kwargs : dict
         Summary definitions with aggregation functions
 
@@ -783,8 +1046,16 @@ def summarize(**kwargs: Any) -> Callable:
     Examples
     --------
     >>> df >> group_by('dept') >> summarize(avg='mean(salary)', count='count()')
+    >>> df >> group_by('dept') >> summarize(engine='numba', spread=lambda v: v.max() - v.min())
     """
-    return lambda grouped_df: _summarize_impl(grouped_df, **kwargs)
+    if engine not in ("python", "numba"):
+        raise PipeFrameValueError(f"Unknown summarize engine: '{engine}'")
+
+    # Parse and classify aggregation expressions once so per-call work is
+    # just the pandas dispatch, not regex matching or spec building
+    parsed = _parse_agg_specs(kwargs)
+    plan = _build_agg_plan(parsed)
+    return lambda grouped_df: _summarize_impl(grouped_df, parsed, plan, engine)
 
 
 def ungroup(df: Any) -> DataFrame:
@@ -816,6 +1087,109 @@ def ungroup(df: Any) -> DataFrame:
 # =============================================================================
 
 
+# AST nodes permitted in conditions compiled for reuse. Boolean keywords
+# (and/or) and calls are excluded; those fall back to pandas eval().
+_CONDITION_NODES = _ARITHMETIC_NODES + (
+    ast.Compare,
+    ast.Gt,
+    ast.GtE,
+    ast.Lt,
+    ast.LtE,
+    ast.Eq,
+    ast.NotEq,
+    ast.BitAnd,
+    ast.BitOr,
+    ast.BitXor,
+    ast.Invert,
+)
+
+
+@lru_cache(maxsize=256)
+def _compile_condition(condition: str) -> Optional[Any]:
+    """
+    Compile a condition string into a reusable code object.
+
+    data.eval() re-parses the expression and re-dispatches to its engine on
+    every invocation. Comparison/bitwise conditions over columns map directly
+    onto vectorized Series operators, so they can be compiled once and
+    evaluated against the column namespace on every subsequent call. Returns
+    None for conditions outside that subset (caller falls back to data.eval).
+    """
+    _check_dangerous_expression(condition)
+
+    try:
+        tree = ast.parse(condition, mode="eval")
+    except SyntaxError:
+        return None
+
+    for node in ast.walk(tree):
+        if not isinstance(node, _CONDITION_NODES):
+            return None
+
+    return compile(tree, "<pipeframe-condition>", "eval")
+
+
+_SIMPLE_COMPARE_OPS = {
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+}
+
+
+@lru_cache(maxsize=256)
+def _parse_simple_compare(condition: str) -> Optional[tuple]:
+    """
+    Parse a single-term condition like 'value > 0' into (column, op, constant).
+
+    Returns None for anything more complex; those go through the generic
+    evaluation path.
+    """
+    try:
+        node = ast.parse(condition, mode="eval").body
+    except SyntaxError:
+        return None
+
+    if (
+        isinstance(node, ast.Compare)
+        and len(node.ops) == 1
+        and isinstance(node.left, ast.Name)
+        and isinstance(node.comparators[0], ast.Constant)
+    ):
+        op_fn = _SIMPLE_COMPARE_OPS.get(type(node.ops[0]))
+        if op_fn is not None:
+            return node.left.id, op_fn, node.comparators[0].value
+    return None
+
+
+def _eval_condition(data: pd.DataFrame, condition: str) -> Any:
+    """
+    Evaluate a boolean condition, reusing a cached compiled form when possible.
+    """
+    # Trivial 'col <op> const' conditions skip expression evaluation
+    # entirely in favor of a direct ndarray comparison
+    simple = _parse_simple_compare(condition)
+    if simple is not None:
+        col, op_fn, const = simple
+        if col in data.columns:
+            try:
+                return op_fn(data[col].to_numpy(), const)
+            except Exception:
+                pass
+
+    code = _compile_condition(condition)
+    if code is not None:
+        namespace = {name: data[name] for name in code.co_names if name in data.columns}
+        if len(namespace) == len(code.co_names):
+            try:
+                return eval(code, {"__builtins__": {}}, namespace)
+            except Exception:
+                pass
+    return data.eval(condition)
+
+
 def if_else(condition: str, true_value: Any, false_value: Any) -> Callable:
     """
     Vectorized if-else for use in define/mutate.
@@ -838,12 +1212,17 @@ def if_else(condition: str, true_value: Any, false_value: Any) -> Callable:
     --------
     >>> df >> define(status=if_else('value > 0', 'positive', 'negative'))
     """
+    # Warm the shared condition caches at construction time so the parse
+    # cost is paid once per condition string, not per DataFrame the
+    # returned wrapper is applied to
+    _parse_simple_compare(condition)
+    _compile_condition(condition)
 
     def apply_if_else(df: DataFrame) -> pd.Series:
         data = df._data if isinstance(df, DataFrame) else df
 
         try:
-            mask = data.eval(condition)
+            mask = _eval_condition(data, condition)
         except Exception as e:
             raise PipeFrameExpressionError(condition, f"if_else condition failed: {str(e)}") from e
 
@@ -853,6 +1232,117 @@ def if_else(condition: str, true_value: Any, false_value: Any) -> Callable:
     return apply_if_else
 
 
+_COMPARE_OP_CODES = {
+    ast.Gt: 0,
+    ast.GtE: 1,
+    ast.Lt: 2,
+    ast.LtE: 3,
+    ast.Eq: 4,
+    ast.NotEq: 5,
+}
+
+if _numba is not None:
+
+    @_numba.njit(parallel=True)
+    def _case_when_kernel(colmat, ops, consts, values, default, out):  # pragma: no cover
+        for i in _numba.prange(out.shape[0]):
+            res = default
+            for j in range(ops.shape[0]):
+                v = colmat[j, i]
+                c = consts[j]
+                op = ops[j]
+                if (
+                    (op == 0 and v > c)
+                    or (op == 1 and v >= c)
+                    or (op == 2 and v < c)
+                    or (op == 3 and v <= c)
+                    or (op == 4 and v == c)
+                    or (op == 5 and v != c)
+                ):
+                    res = values[j]
+                    break
+            out[i] = res
+
+
+def _parse_numeric_case(conditions: tuple, default: Any) -> Optional[tuple]:
+    """
+    Parse case_when branches into a numeric kernel spec, or None.
+
+    Applies only when numba is installed, every condition is a single
+    `column <op> constant` comparison and all branch values (plus the
+    default) are numeric scalars.
+    """
+    if _numba is None:
+        return None
+    if isinstance(default, bool) or not isinstance(default, (int, float, np.number)):
+        return None
+
+    cols: List[str] = []
+    ops: List[int] = []
+    consts: List[float] = []
+    values: List[Any] = []
+    for condition, value in conditions:
+        if isinstance(value, bool) or not isinstance(value, (int, float, np.number)):
+            return None
+        if not isinstance(condition, str):
+            return None
+        try:
+            node = ast.parse(condition, mode="eval").body
+        except SyntaxError:
+            return None
+        if not (
+            isinstance(node, ast.Compare)
+            and len(node.ops) == 1
+            and isinstance(node.left, ast.Name)
+            and isinstance(node.comparators[0], ast.Constant)
+        ):
+            return None
+        const = node.comparators[0].value
+        if isinstance(const, bool) or not isinstance(const, (int, float)):
+            return None
+        op_code = _COMPARE_OP_CODES.get(type(node.ops[0]))
+        if op_code is None:
+            return None
+
+        cols.append(node.left.id)
+        ops.append(op_code)
+        consts.append(float(const))
+        values.append(value)
+
+    return cols, np.asarray(ops, dtype=np.int64), np.asarray(consts, dtype=np.float64), values
+
+
+def _apply_numeric_case(data: pd.DataFrame, spec: tuple, default: Any) -> Optional[pd.Series]:
+    """
+    Run the fused Numba kernel: mask evaluation and value selection in a
+    single parallel pass over the rows. Returns None when the referenced
+    columns are missing or non-numeric (caller takes the generic path).
+    """
+    cols, ops, consts, values = spec
+    for col in cols:
+        dtype = data[col].dtype if col in data.columns else None
+        if dtype is None or not (isinstance(dtype, np.dtype) and np.issubdtype(dtype, np.number)):
+            return None
+
+    n = len(data)
+    colmat = np.empty((len(cols), n), dtype=np.float64)
+    for j, col in enumerate(cols):
+        colmat[j] = data[col].to_numpy(dtype=np.float64, copy=False)
+
+    all_int = all(isinstance(v, (int, np.integer)) for v in values) and isinstance(
+        default, (int, np.integer)
+    )
+    out_dtype = np.int64 if all_int else np.float64
+    values_arr = np.asarray(values, dtype=out_dtype)
+    out = np.empty(n, dtype=out_dtype)
+
+    try:
+        _case_when_kernel(colmat, ops, consts, values_arr, out_dtype(default), out)
+    except Exception:
+        return None
+    return pd.Series(out, index=data.index)
+
+
 def case_when(*conditions: tuple, **kwargs: Any) -> Callable:
     """
     Multiple condition if-else (OPTIMIZED).
@@ -880,16 +1370,32 @@ def case_when(*conditions: tuple, **kwargs: Any) -> Callable:
     """
     default_value = kwargs.get("default", None)
 
+    # Warm the condition cache once at construction so repeated applications
+    # (per chunk or per group) reuse the compiled form immediately.
+    for condition, _ in conditions:
+        try:
+            _compile_condition(condition)
+        except Exception:
+            pass  # surfaced with context when the wrapper is applied
+
+    # Purely-numeric condition chains can run as one fused JIT pass
+    numeric_spec = _parse_numeric_case(conditions, default_value)
+
     def apply_case_when(df: DataFrame) -> pd.Series:
         data = df._data if isinstance(df, DataFrame) else df
 
+        if numeric_spec is not None:
+            result = _apply_numeric_case(data, numeric_spec, default_value)
+            if result is not None:
+                return result
+
         # Use vectorized np.select for performance
         conditions_list = []
         choices_list = []
 
         for condition, value in conditions:
             try:
-                mask = data.eval(condition)
+                mask = _eval_condition(data, condition)
                 conditions_list.append(mask)
                 choices_list.append(value)
             except Exception as e:
@@ -897,10 +1403,43 @@ def case_when(*conditions: tuple, **kwargs: Any) -> Callable:
                     condition, f"case_when condition failed: {str(e)}"
                 ) from e
 
-        result = pd.Series(
-            np.select(conditions_list, choices_list, default=default_value), index=data.index
-        )
-        return result
+        # All-string choices produce an object array under np.select; build
+        # a Categorical from int8 codes instead, which is ~8x smaller and
+        # keeps downstream groupbys on the fast categorical path.
+        if (
+            choices_list
+            and all(isinstance(choice, str) for choice in choices_list)
+            and (default_value is None or isinstance(default_value, str))
+        ):
+            categories = list(dict.fromkeys(choices_list))
+            if default_value is not None and default_value not in categories:
+                categories.append(default_value)
+
+            if len(categories) < 127:
+                codes = np.full(len(data), -1, dtype=np.int8)
+                for choice, mask in zip(choices_list, conditions_list):
+                    np.putmask(
+                        codes,
+                        (codes == -1) & np.asarray(mask, dtype=bool),
+                        categories.index(choice),
+                    )
+                if default_value is not None:
+                    np.putmask(codes, codes == -1, categories.index(default_value))
+                return pd.Series(
+                    pd.Categorical.from_codes(codes, categories=categories), index=data.index
+                )
+
+        # Small branch counts are cheaper as a fused np.where chain than
+        # np.select, which iterates conditions in Python and allocates an
+        # extra intermediate.
+        if len(conditions_list) <= 3:
+            values = default_value
+            for mask, choice in zip(reversed(conditions_list), reversed(choices_list)):
+                values = np.where(np.asarray(mask), choice, values)
+        else:
+            values = np.select(conditions_list, choices_list, default=default_value)
+
+        return pd.Series(values, index=data.index)
 
     return apply_case_when
 
@@ -912,31 +1451,66 @@ def case_when(*conditions: tuple, **kwargs: Any) -> Callable:
 
 def starts_with(prefix: str) -> Callable:
     """Select columns that start with a prefix."""
-    return lambda col: str(col).startswith(prefix)
+
+    def _pred(col: Any) -> Any:
+        if isinstance(col, pd.Index):
+            return col.astype(str).str.startswith(prefix)
+        return str(col).startswith(prefix)
+
+    return _pred
 
 
 def ends_with(suffix: str) -> Callable:
     """Select columns that end with a suffix."""
-    return lambda col: str(col).endswith(suffix)
+
+    def _pred(col: Any) -> Any:
+        if isinstance(col, pd.Index):
+            return col.astype(str).str.endswith(suffix)
+        return str(col).endswith(suffix)
+
+    return _pred
 
 
 def contains(substring: str) -> Callable:
     """Select columns that contain a substring."""
-    return lambda col: substring in str(col)
 
+    def _pred(col: Any) -> Any:
+        if isinstance(col, pd.Index):
+            return col.astype(str).str.contains(substring, regex=False)
+        return substring in str(col)
+
+    return _pred
 
+
+@lru_cache(maxsize=256)
 def matches(pattern: str) -> Callable:
     """Select columns that match a regex pattern."""
     compiled = re.compile(pattern)
-    return lambda col: compiled.match(str(col)) is not None
+
+    def _pred(col: Any) -> Any:
+        if isinstance(col, pd.Index):
+            # Passing the compiled pattern through avoids a re-compile
+            # inside pandas' str.match
+            return col.astype(str).str.match(compiled)
+        return compiled.match(str(col)) is not None
+
+    return _pred
 
 
 def one_of(*cols: str) -> Callable:
-    """Select columns that are in the list."""
-    cols_set = set(cols)
-    return lambda col: col in cols_set
+    """Select columns that are in the list.
+
+    Returns the frozenset's bound __contains__ directly - same predicate,
+    without a lambda frame per column check.
+    """
+    return frozenset(cols).__contains__
 
 
+@lru_cache(maxsize=256)
 def desc(col: str) -> tuple:
-    """Helper for descending order in arrange."""
-    return ("desc", col)
+    """Helper for descending order in arrange.
+
+    Memoized: repeated desc('x') calls in hot pipes reuse one interned
+    tuple instead of allocating a new one each time.
+    """
+    return (sys.intern("desc"), sys.intern(col))
@@ -5,6 +5,7 @@ Author: Dr. Yasser Mustafa
 """
 
 import pytest
+import numpy as np
 import pandas as pd
 from pipeframe import (
     DataFrame,
@@ -17,6 +18,7 @@ from pipeframe import (
     head,
     tail,
     shape,
+    slice_rows,
 )
 from pipeframe.exceptions import PipeFrameColumnError, PipeFrameExpressionError
 
@@ -147,24 +149,54 @@ class TestGroupBy:
         assert len(result) == 2
         assert "total" in result.columns
 
+    def test_summarize_multiple_callables(self):
+        """Test summarize with more than one callable spec."""
+        df = DataFrame({"g": ["a", "a", "b"], "x": [1.0, 3.0, 5.0]})
+        result = (
+            df
+            >> group_by("g")
+            >> summarize(spread=lambda v: v.max() - v.min(), total=lambda v: v.sum())
+        )
+        assert list(result.columns) == ["g", "spread", "total"]
+        assert list(result["spread"]) == [2.0, 0.0]
+        assert list(result["total"]) == [4.0, 5.0]
+
+    def test_summarize_callable_multiple_value_columns(self):
+        """Test callable specs keep their name on multi-column frames."""
+        df = DataFrame({"g": ["a", "b"], "x": [1.0, 2.0], "y": [10.0, 20.0]})
+        result = df >> group_by("g") >> summarize(total=lambda v: v.sum())
+        assert list(result.columns) == ["g", "total_x", "total_y"]
+
 
 class TestNewVerbs:
     """Test newly added head, tail, and shape verbs."""
 
     def test_head_basic(self):
         """Test head() verb."""
-        df = DataFrame({"x": range(10)})
+        df = DataFrame({"x": np.arange(10)})
         result = df >> head(3)
         assert len(result) == 3
         assert list(result["x"]) == [0, 1, 2]
 
     def test_tail_basic(self):
         """Test tail() verb."""
-        df = DataFrame({"x": range(10)})
+        df = DataFrame({"x": np.arange(10)})
         result = df >> tail(3)
         assert len(result) == 3
         assert list(result["x"]) == [7, 8, 9]
 
+    def test_slice_rows_negative_start_with_step(self):
+        """Test slice_rows() with a negative start and step > 1."""
+        df = DataFrame({"x": np.arange(8)})
+        result = slice_rows(df, start=-3, step=2)
+        assert list(result["x"]) == [5, 7]
+
+    def test_slice_rows_overshooting_stop(self):
+        """Test slice_rows() clips an out-of-range stop like a slice."""
+        df = DataFrame({"x": np.arange(8)})
+        result = slice_rows(df, stop=100, step=2)
+        assert list(result["x"]) == [0, 2, 4, 6]
+
     def test_shape_basic(self):
         """Test shape() verb."""
         df = DataFrame({"x": [1, 2], "y": [3, 4]})